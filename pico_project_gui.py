@@ -0,0 +1,607 @@
+#
+# Copyright (c) 2020-2023 Raspberry Pi (Trading) Ltd.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+# The GUI front end for pico_project.py. This is only imported when the GUI is
+# actually wanted, so the command line version does not have to load tkinter.
+
+import os
+import sys
+import subprocess
+import threading
+import queue
+import codecs
+from pathlib import Path
+
+try:
+    import tkinter as tk
+    from tkinter import \
+        messagebox as mb, \
+        filedialog as fd, \
+        simpledialog as sd, \
+        ttk
+
+except ImportError:
+    print("[\033[91mERROR\033[0m] tkinter module not found")
+    sys.exit(1)
+
+from pico_project import \
+    ExitCodes, \
+    CONFIG_UNSET, \
+    features_list, \
+    picow_options_list, \
+    debugger_list, \
+    GetFilePath, \
+    Parameters, \
+    DoEverything
+
+BACKGROUND_COLOUR = 'white'
+BUTTON_BACKGROUND_COLOUR = 'white'
+TEXT_COLOUR = 'black'
+BUTTON_TEXT_COLOUR = '#c51a4a'
+
+def RunGUI(sdkpath, args, boardtypes, configurations):
+    root = tk.Tk()
+    style = ttk.Style(root)
+    style.theme_use('default')
+
+    style.configure("TButton", padding=6, relief="groove", border=2, foreground=BUTTON_TEXT_COLOUR, background=BUTTON_BACKGROUND_COLOUR)
+    for name in ("TLabel", "TCheckbutton", "TRadiobutton", "TLabelframe", "TLabelframe.Label", "TCombobox", "TListbox"):
+        style.configure(name, foreground=TEXT_COLOUR, background=BACKGROUND_COLOUR)
+
+    for name in ("TCheckbutton", "TRadiobutton", "TButton"):
+        style.map(name, background = [('disabled', BACKGROUND_COLOUR)])
+    style.map("TLabel", background = [('background', BACKGROUND_COLOUR)])
+
+    app = ProjectWindow(root, sdkpath, args, boardtypes, configurations)
+
+    app.configure(background=BACKGROUND_COLOUR)
+
+    root.mainloop()
+    sys.exit(ExitCodes.SUCCESS)
+
+def RunWarning(message):
+    mb.showwarning('Raspberry Pi Pico Project Generator', message)
+    sys.exit(ExitCodes.SUCCESS)
+
+def thread_function(output, command, cwd):
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=cwd)
+    except OSError as e:
+        output.put(f'Unable to run {command[0]}: {e.strerror}\n'.encode())
+        output.put(None)
+        return
+
+    # Read whatever is available in big chunks rather than line by line, the
+    # display window picks them up from the queue and shows them in batches.
+    # Leaving the with block closes our end of the pipe and waits for the process
+    with proc:
+        fd = proc.stdout.fileno()
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            output.put(data)
+    output.put(None) # Tell the display window we are done
+
+# Function to run an OS command and display the output in a new modal window
+class DisplayWindow(tk.Toplevel):
+    def __init__(self, parent, title):
+        tk.Toplevel.__init__(self, parent)
+        self.parent = parent
+        self.output = queue.Queue()
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.init_window(title)
+
+    def init_window(self, title):
+        self.title(title)
+
+        frame = tk.Frame(self, borderwidth=5, relief=tk.RIDGE)
+        frame.pack(fill=tk.X, expand=True, side=tk.TOP)
+
+        scrollbar = tk.Scrollbar(frame)
+        self.text = tk.Text(frame, bg='gray14', fg='gray99')
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill=tk.Y)
+        scrollbar.config(command=self.text.yview)
+        self.text.config(yscrollcommand=scrollbar.set)
+
+        frame1 = tk.Frame(self, borderwidth=1)
+        frame1.pack(fill=tk.X, expand=True, side=tk.BOTTOM)
+        self.OKButton = ttk.Button(frame1, text="OK", command=self.OK)
+        self.OKButton["state"] = tk.DISABLED
+        self.OKButton.pack()
+
+        # make dialog modal
+        self.transient(self.parent)
+        self.grab_set()
+
+    def drain(self):
+        # Display everything the command has output since the last call in one go,
+        # then check back in 50ms. This stops a chatty build flooding the Tk event loop
+        batch = []
+        finished = False
+        while True:
+            try:
+                data = self.output.get_nowait()
+            except queue.Empty:
+                break
+            if data is None:
+                finished = True
+                break
+            batch.append(data)
+
+        # On the last pass also flush any partial character the decoder is holding on to
+        text = self.decoder.decode(b''.join(batch), final=finished)
+        if text:
+            self.text.insert(tk.END, text)
+            self.text.see(tk.END)
+
+        if finished:
+            self.OKButton["state"] = tk.NORMAL
+        else:
+            self.after(50, self.drain)
+
+    def OK(self):
+        self.grab_release()
+        self.destroy()
+
+def RunCommandInWindow(parent, command, cwd=None):
+    w = DisplayWindow(parent, ' '.join(command))
+    x = threading.Thread(target=thread_function, args=(w.output, command, cwd))
+    x.start()
+    w.drain()
+    parent.wait_window(w)
+
+class EditBoolWindow(sd.Dialog):
+
+    def __init__(self, parent, configitem, current):
+        self.parent = parent
+        self.config_item = configitem
+        self.current = current
+        sd.Dialog.__init__(self, parent, "Edit boolean configuration")
+
+
+    def body(self, master):
+        self.configure(background=BACKGROUND_COLOUR)
+        ttk.Label(self, text=self.config_item.name).pack()
+        self.result = tk.StringVar()
+        self.result.set(self.current)
+        ttk.Radiobutton(master, text="True", variable=self.result, value="True").pack(anchor=tk.W)
+        ttk.Radiobutton(master, text="False", variable=self.result, value="False").pack(anchor=tk.W)
+        ttk.Radiobutton(master, text=CONFIG_UNSET, variable=self.result, value=CONFIG_UNSET).pack(anchor=tk.W)
+
+    def get(self):
+        return self.result.get()
+
+class EditIntWindow(sd.Dialog):
+
+    def __init__(self, parent, configitem, current):
+        self.parent = parent
+        self.config_item = configitem
+        self.current = current
+        sd.Dialog.__init__(self, parent, "Edit integer configuration")
+
+    def body(self, master):
+        self.configure(background=BACKGROUND_COLOUR)
+        label = f"{self.config_item.name}  Max = {self.config_item.max}  Min = {self.config_item.min}"
+        ttk.Label(self, text=label).pack()
+        self.input =  tk.Entry(self)
+        self.input.pack(pady=4)
+        self.input.insert(0, self.current)
+        ttk.Button(self, text=CONFIG_UNSET, command=self.unset).pack(pady=5)
+
+    def validate(self):
+        self.result = self.input.get()
+        # Check for numeric entry
+        return True
+
+    def unset(self):
+        self.result = CONFIG_UNSET
+        self.destroy()
+
+    def get(self):
+        return self.result
+
+class EditEnumWindow(sd.Dialog):
+    def __init__(self, parent, configitem, current):
+        self.parent = parent
+        self.config_item = configitem
+        self.current = current
+        sd.Dialog.__init__(self, parent, "Edit Enumeration configuration")
+
+    def body(self, master):
+        #self.configure(background=BACKGROUND_COLOUR)
+        values = self.config_item.enumvalues.split('|')
+        values.insert(0,'Not set')
+        self.input =  ttk.Combobox(self, values=values, state='readonly')
+        self.input.set(self.current)
+        self.input.pack(pady=12)
+
+    def validate(self):
+        self.result = self.input.get()
+        return True
+
+    def get(self):
+        return self.result
+
+
+class ConfigurationWindow(tk.Toplevel):
+
+    def __init__(self, parent, initial_config, configurations):
+        tk.Toplevel.__init__(self, parent)
+        self.master = parent
+        self.results = initial_config
+        self.configurations = configurations
+        self.init_window(self)
+
+    def init_window(self, args):
+        self.configure(background=BACKGROUND_COLOUR)
+        self.title("Advanced Configuration")
+        ttk.Label(self, text="Select the advanced options you wish to enable or change. Note that you really should understand the implications of changing these items before using them!").grid(row=0, column=0, columnspan=5)
+
+        okButton = ttk.Button(self, text="OK", command=self.ok)
+        cancelButton = ttk.Button(self, text="Cancel", command=self.cancel)
+
+        # A single table for all the config items, each row is keyed (iid) on the config name
+        self.tree = ttk.Treeview(self, columns=('name', 'type', 'min', 'max', 'default', 'value'), show='headings', selectmode=tk.BROWSE)
+        for column, heading, width in (('name', "Name", 400), ('type', "Type", 60), ('min', "Min", 80), ('max', "Max", 80), ('default', "Default", 80), ('value', "User", 80)):
+            self.tree.heading(column, text=heading, anchor=tk.W)
+            self.tree.column(column, width=width, stretch=(column == 'name'))
+        self.tree.tag_configure('set', background='green')
+
+        self.descriptionText = tk.Text(self, state=tk.DISABLED, height=2)
+
+        scroll = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.config(yscrollcommand=scroll.set)
+
+        self.tree.bind("<<TreeviewSelect>>", self.changeSelection)
+        self.tree.bind("<Double-Button>", self.doubleClick)
+
+        self.tree.grid(row=1, column=0, columnspan=6, sticky=tk.W + tk.E)
+        scroll.grid(row=1, column=7, sticky=tk.N + tk.S)
+
+        self.descriptionText.grid(row = 2, column=0, columnspan=4, sticky=tk.W + tk.E)
+        cancelButton.grid(column=5, row = 2, padx=5)
+        okButton.grid(column=4, row = 2, sticky=tk.E, padx=5)
+
+        # Keep our own copy of the user settings, so OK doesn't have to read them all back out of the table
+        self.userValues = dict(self.results)
+
+        # populate the table with our config options
+        for conf in self.configurations:
+            s = conf.type
+            if s == "":
+                s = "int"
+
+            # see if this config has a setting, our results member has this predefined from init
+            val = self.results.get(conf.name, CONFIG_UNSET)
+            self.tree.insert('', tk.END, iid=conf.name, values=(conf.name, s, conf.min, conf.max, conf.default, val), tags=self.valueTags(val))
+
+        # index the configs by name so the selection callbacks don't have to search the whole list
+        self._config_by_name = {conf.name: conf for conf in self.configurations}
+
+    def valueTags(self, val):
+        return ('set',) if val != CONFIG_UNSET else ()
+
+    def changeSelection(self, evt):
+        sellist = self.tree.selection()
+
+        if sellist:
+            config = sellist[0]
+            # Now find the description for that config in the dictionary
+            conf = self._config_by_name.get(config)
+            if conf:
+                self.descriptionText.config(state=tk.NORMAL)
+                self.descriptionText.delete(1.0,tk.END)
+                self.descriptionText.insert(1.0, f"{config}\n{conf.description}")
+                self.descriptionText.config(state=tk.DISABLED)
+
+    def doubleClick(self, evt):
+        config = self.tree.identify_row(evt.y)
+        # Get the associated dict entry from our list of configs
+        conf = self._config_by_name.get(config)
+        if conf:
+            current = self.userValues.get(config, CONFIG_UNSET)
+            if (conf.type == 'bool'):
+                result = EditBoolWindow(self, conf, current).get()
+            elif (conf.type == 'int' or conf.type == ""): # "" defaults to int
+                result = EditIntWindow(self, conf, current).get()
+            elif conf.type == 'enum':
+                result = EditEnumWindow(self, conf, current).get()
+
+            # Update the table with our new item
+            self.tree.set(config, 'value', result)
+            self.tree.item(config, tags=self.valueTags(result))
+
+            if result != CONFIG_UNSET:
+                self.userValues[config] = result
+            else:
+                self.userValues.pop(config, None)
+
+    def ok(self):
+        # Update the results in place, our caller already holds a reference to them
+        self.results.clear()
+        self.results.update(self.userValues)
+
+        self.destroy()
+
+    def cancel(self):
+        self.destroy()
+
+    def get(self):
+        return self.results
+
+class WirelessSettingsWindow(sd.Dialog):
+
+    def __init__(self, parent):
+        sd.Dialog.__init__(self, parent, "Wireless settings")
+        self.parent = parent
+
+    def body(self, master):
+        self.configure(background=BACKGROUND_COLOUR)
+        master.configure(background=BACKGROUND_COLOUR)
+        self.ssid = tk.StringVar()
+        self.password = tk.StringVar()
+
+        a = ttk.Label(master, text='SSID :', background=BACKGROUND_COLOUR)
+        a.grid(row=0, column=0, sticky=tk.E)
+        a.configure(background=BACKGROUND_COLOUR)
+        ttk.Entry(master, textvariable=self.ssid).grid(row=0, column=1, sticky=tk.W+tk.E, padx=5)
+
+        ttk.Label(master, text='Password :').grid(row=1, column=0, sticky=tk.E)
+        ttk.Entry(master, textvariable=self.password).grid(row=1, column=1, sticky=tk.W+tk.E, padx=5)
+
+        self.transient(self.parent)
+        self.grab_set()
+
+    def ok(self):
+        self.grab_release()
+        self.destroy()
+
+    def cancel(self):
+        self.destroy()
+
+    def get(self):
+        return (self.ssid.get(), self.password.get())
+
+# Our main window
+class ProjectWindow(tk.Frame):
+
+    def __init__(self, parent, sdkpath, args, boardtypes, configurations):
+        tk.Frame.__init__(self, parent)
+        self.master = parent
+        self.sdkpath = sdkpath
+        self.boardtypes = boardtypes
+        self.configurations = configurations
+        self.init_window(args)
+        self.configs = dict()
+        self.ssid = ''
+        self.password = ''
+
+    def setState(self, thing, state):
+        for child in thing.winfo_children():
+            child.configure(state=state)
+
+    def boardtype_change_callback(self, event):
+        boardtype = self.boardtype.get()
+        if boardtype == "pico_w":
+            self.setState(self.picowSubframe, "enabled")
+        else:
+            self.setState(self.picowSubframe, "disabled")
+
+    def wirelessSettings(self):
+        result = WirelessSettingsWindow(self)
+        self.ssid, self.password = result.get()
+
+    def init_window(self, args):
+        self.master.title("Raspberry Pi Pico Project Generator")
+        self.master.configure(bg=BACKGROUND_COLOUR)
+
+        optionsRow = 0
+
+        mainFrame = tk.Frame(self, bg=BACKGROUND_COLOUR).grid(row=optionsRow, column=0, columnspan=6, rowspan=12)
+
+        # Need to keep a reference to the image or it will not appear.
+        self.logo = tk.PhotoImage(file=GetFilePath("logo_alpha.gif"))
+        logowidget = ttk.Label(mainFrame, image=self.logo, borderwidth=0, relief="solid").grid(row=0,column=0, columnspan=5, pady=10)
+
+        optionsRow += 2
+
+        namelbl = ttk.Label(mainFrame, text='Project Name :').grid(row=optionsRow, column=0, sticky=tk.E)
+        self.projectName = tk.StringVar()
+
+        if args.name != None:
+            self.projectName.set(args.name)
+        else:
+            self.projectName.set('ProjectName')
+
+        nameEntry = ttk.Entry(mainFrame, textvariable=self.projectName).grid(row=optionsRow, column=1, sticky=tk.W+tk.E, padx=5)
+
+        optionsRow += 1
+
+        locationlbl = ttk.Label(mainFrame, text='Location :').grid(row=optionsRow, column=0, sticky=tk.E)
+        self.locationName = tk.StringVar()
+        self.locationName.set(os.getcwd() if not args.projectRoot else args.projectRoot)
+        locationEntry = ttk.Entry(mainFrame, textvariable=self.locationName).grid(row=optionsRow, column=1, columnspan=3, sticky=tk.W+tk.E, padx=5)
+        locationBrowse = ttk.Button(mainFrame, text='Browse', command=self.browse).grid(row=3, column=4)
+
+        optionsRow += 1
+
+        ttk.Label(mainFrame, text = "Board Type :").grid(row=optionsRow, column=0, padx=4, sticky=tk.E)
+        self.boardtype = ttk.Combobox(mainFrame, values=self.boardtypes, )
+        self.boardtype.grid(row=4, column=1, padx=4, sticky=tk.W+tk.E)
+        self.boardtype.set('pico')
+        self.boardtype.bind('<<ComboboxSelected>>',self.boardtype_change_callback)
+        optionsRow += 1
+
+        # Features section
+        featuresframe = ttk.LabelFrame(mainFrame, text="Library Options", relief=tk.RIDGE, borderwidth=2)
+        featuresframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=5, ipadx=5, padx=5, pady=5, sticky=tk.E+tk.W)
+
+        # Lay the features out in three columns, filling each column top to bottom
+        rows_per_col = (len(features_list) + 2) // 3
+
+        # Selected features are tracked as the boxes are toggled, rather than polled on OK
+        self._selected_features = set()
+        for idx, (i, feature) in enumerate(features_list.items()):
+            col, row = divmod(idx, rows_per_col)
+            var = tk.IntVar(value=0) # Off by default for the moment
+            cb = ttk.Checkbutton(featuresframe, text = feature.gui_text, variable=var,
+                                 command=lambda v=var, name=i: self._toggle_feature(name, v))
+            cb.grid(row=row, column=col, padx=15, pady=2, ipadx=1, ipady=1, sticky=tk.E+tk.W)
+
+        optionsRow += 5
+
+        # PicoW options section
+        self.picowSubframe = ttk.LabelFrame(mainFrame, relief=tk.RIDGE, borderwidth=2, text="Pico Wireless Options")
+        self.picowSubframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=2, padx=5, pady=5, ipadx=5, ipady=3, sticky=tk.E+tk.W)
+        self.pico_wireless = tk.StringVar()
+
+        # Three options per row
+        for idx, (i, option) in enumerate(picow_options_list.items()):
+            row, col = divmod(idx, 3)
+            rb = ttk.Radiobutton(self.picowSubframe, text=option.gui_text, variable=self.pico_wireless, val=i)
+            rb.grid(row=row, column=col,  padx=15, pady=1, sticky=tk.E+tk.W)
+
+        # DOnt actually need any settings at the moment.
+        # ttk.Button(self.picowSubframe, text='Settings', command=self.wirelessSettings).grid(row=0, column=4, padx=5, pady=2, sticky=tk.E)
+
+        self.setState(self.picowSubframe, "disabled")
+
+        optionsRow += 3
+
+        # output options section
+        ooptionsSubframe = ttk.LabelFrame(mainFrame, relief=tk.RIDGE, borderwidth=2, text="Console Options")
+        ooptionsSubframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=2, padx=5, pady=5, ipadx=5, ipady=3, sticky=tk.E+tk.W)
+
+        # Code options section
+        coptionsSubframe = ttk.LabelFrame(mainFrame, relief=tk.RIDGE, borderwidth=2, text="Code Options")
+        ttk.Button(coptionsSubframe, text="Advanced...", command=self.config).grid(row=0, column=4, sticky=tk.E)
+
+        # Build Options section
+        boptionsSubframe = ttk.LabelFrame(mainFrame, relief=tk.RIDGE, borderwidth=2, text="Build Options")
+
+        # (attribute, label, initial value, frame, row, column) for each simple option checkbox
+        checkbox_specs = (
+            ('wantUART',          "Console over UART",                        args.uart,          ooptionsSubframe, 0, 0),
+            ('wantUSB',           "Console over USB (Disables other USB use)", args.usb,           ooptionsSubframe, 0, 1),
+            ('wantExamples',      "Add examples for Pico library",            args.examples,      coptionsSubframe, 0, 0),
+            ('wantRunFromRAM',    "Run from RAM",                             args.runFromRAM,    coptionsSubframe, 0, 1),
+            ('wantCPP',           "Generate C++",                             args.cpp,           coptionsSubframe, 0, 3),
+            ('wantCPPExceptions', "Enable C++ exceptions",                    args.cppexceptions, coptionsSubframe, 1, 0),
+            ('wantCPPRTTI',       "Enable C++ RTTI",                          args.cpprtti,       coptionsSubframe, 1, 1),
+            ('wantBuild',         "Run build after generation",               args.build,         boptionsSubframe, 0, 0),
+            ('wantOverwrite',     "Overwrite existing projects",              args.overwrite,     boptionsSubframe, 0, 1),
+        )
+
+        for attr, label, initial, frame, r, c in checkbox_specs:
+            var = tk.IntVar(value=initial)
+            setattr(self, attr, var)
+            ttk.Checkbutton(frame, text=label, variable=var).grid(row=r, column=c, padx=4, sticky=tk.W)
+
+        optionsRow += 2
+
+        coptionsSubframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=3, padx=5, pady=5, ipadx=5, ipady=3, sticky=tk.E+tk.W)
+        optionsRow += 3
+
+        boptionsSubframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=2, padx=5, pady=5, ipadx=5, ipady=3, sticky=tk.E+tk.W)
+        optionsRow += 2
+
+        # IDE Options section
+
+        vscodeoptionsSubframe = ttk.LabelFrame(mainFrame, relief=tk.RIDGE, borderwidth=2, text="IDE Options")
+        vscodeoptionsSubframe.grid(row=optionsRow, column=0, columnspan=5, rowspan=2, padx=5, pady=5, ipadx=5, ipady=3, sticky=tk.E+tk.W)
+
+        self.wantVSCode = tk.IntVar()
+        if args.project is None:
+            self.wantVSCode.set(False)
+        else:
+            self.wantVSCode.set('vscode' in args.project)
+        ttk.Checkbutton(vscodeoptionsSubframe, text="Create VSCode project", variable=self.wantVSCode).grid(row=0, column=0, padx=4, sticky=tk.W)
+
+        ttk.Label(vscodeoptionsSubframe, text = "     Debugger:").grid(row=0, column=1, padx=4, sticky=tk.W)
+
+        self.debugger = ttk.Combobox(vscodeoptionsSubframe, values=debugger_list, state="readonly")
+        self.debugger.grid(row=0, column=2, padx=4, sticky=tk.W)
+        self.debugger.current(args.debugger)
+
+        optionsRow += 2
+
+        # OK, Cancel, Help section
+        # creating buttons
+        QuitButton = ttk.Button(mainFrame, text="Quit", command=self.quit).grid(row=optionsRow, column=4, stick=tk.E, padx=10, pady=5)
+        OKButton = ttk.Button(mainFrame, text="OK", command=self.OK).grid(row=optionsRow, column=3, padx=4, pady=5, sticky=tk.E)
+
+        # TODO help not implemented yet
+        # HelpButton = ttk.Button(mainFrame, text="Help", command=self.help).grid(row=optionsRow, column=0, pady=5)
+
+        # You can set a default path here, replace the string with whereever you want.
+        # self.locationName.set('/home/pi/pico_projects')
+
+    def _toggle_feature(self, name, var):
+        if var.get():
+            self._selected_features.add(name)
+        else:
+            self._selected_features.discard(name)
+
+    def GetFeatures(self):
+        # Keep the order the features are listed in, so the generated files are stable
+        features = [f for f in features_list if f in self._selected_features]
+
+        picow_extra = self.pico_wireless.get()
+
+        if picow_extra != 'picow_none':
+            features.append(picow_extra)
+
+        return features
+
+    def quit(self):
+        # TODO Check if we want to exit here
+        sys.exit(ExitCodes.SUCCESS)
+
+    def OK(self):
+        # OK, grab all the settings from the page, then call the generators
+        projectPath = self.locationName.get()
+        features = self.GetFeatures()
+        projects = list()
+        if (self.wantVSCode.get()):
+            projects.append("vscode")
+
+        params = Parameters(
+                sdkPath         = self.sdkpath,
+                projectRoot     = Path(projectPath),
+                projectName     = self.projectName.get(),
+                wantGUI         = True,
+                wantOverwrite   = self.wantOverwrite.get(),
+                wantBuild       = self.wantBuild.get(),
+                boardtype       = self.boardtype.get(),
+                features        = features,
+                projects        = projects,
+                configs         = self.configs,
+                wantRunFromRAM  = self.wantRunFromRAM.get(),
+                wantExamples    = self.wantExamples.get(),
+                wantUART        = self.wantUART.get(),
+                wantUSB         = self.wantUSB.get(),
+                wantCPP         = self.wantCPP.get(),
+                debugger        = self.debugger.current(),
+                exceptions      = self.wantCPPExceptions.get(),
+                rtti            = self.wantCPPRTTI.get(),
+                ssid            = self.ssid,
+                password        = self.password,
+                )
+
+        DoEverything(self, params)
+
+    def browse(self):
+        name = fd.askdirectory()
+        self.locationName.set(name)
+
+    def help(self):
+        print("Help TODO")
+
+    def config(self):
+        # Run the configuration window
+        self.configs = ConfigurationWindow(self, self.configs, self.configurations).get()